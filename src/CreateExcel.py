@@ -8,10 +8,14 @@
 # ==============================================================================
 
 import openpyxl
-import json
 import os
 from datetime import datetime
 
+from JsonFile import write_json
+
+# Column headers of the products sheet, also the product dict keys written per row
+HEADERS = ("Product", "Current Price", "Forecast Months", "Country", "Currency")
+
 
 def save_to_excel(product_list, file_path="products.xlsx"):
     """
@@ -29,31 +33,27 @@ def save_to_excel(product_list, file_path="products.xlsx"):
             message: Description of the result or error.
     """
     try:
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Products"
+        # Write-only workbook streams rows to disk instead of keeping every cell in memory
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Products")
 
         # Append header row for Excel sheet
-        headers = ["Product", "Current Price", "Forecast Months", "Country", "Currency"]
-        ws.append(headers)
+        ws.append(HEADERS)
 
-        # Append product data rows
+        # Append product data rows, one tuple per product (no per-row generator or ws.cell calls)
+        append = ws.append
+        name_key, price_key, months_key, country_key, currency_key = HEADERS
         for product in product_list:
-            ws.append([
-                product.get("Product", ""),
-                product.get("Current Price", ""),
-                product.get("Forecast Months", ""),
-                product.get("Country", ""),
-                product.get("Currency", "")
-            ])
+            get = product.get
+            append((get(name_key, ""), get(price_key, ""), get(months_key, ""),
+                    get(country_key, ""), get(currency_key, "")))
 
         # Save the Excel workbook to disk
         wb.save(file_path)
 
         # Create a JSON backup for app state persistence
         json_path = os.path.splitext(file_path)[0] + "_backup.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(product_list, f, ensure_ascii=False, indent=2)
+        write_json(json_path, product_list)
 
         return True, f"Excel file saved successfully to {file_path} (backup: {json_path})"
 
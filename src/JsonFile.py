@@ -0,0 +1,32 @@
+# ==============================================================================
+# Module: JsonFile.py
+# Author: Parsa Shahi
+# Date: 2026-10-15
+# Description:
+#     This module writes the JSON files the app exports (the Excel backup written by
+#     CreateExcel and the optional JSON export of ReadExcel), so both share one format.
+# ==============================================================================
+
+import json
+
+# orjson is optional; it is a much faster encoder than the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(path, obj):
+    """
+    Write `obj` to `path` as indented UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        path (str): Destination file path.
+        obj: JSON-serializable object (typically a list of product dictionaries).
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,104 @@
+# ==============================================================================
+# Module: ProductStore.py
+# Author: Parsa Shahi
+# Date: 2026-10-15
+# Description:
+#     This module provides the in-memory product store used by the GUI.
+#     Products are kept column-wise (one list per field) rather than as a list of
+#     dictionaries, so table rows and numeric columns can be read by index directly.
+#
+#     Dictionaries are only built at the boundaries, when products are handed to
+#     the Excel, JSON and forecast code via to_dicts().
+# ==============================================================================
+
+
+class ProductStore:
+    """
+    Column-oriented storage for product entries.
+
+    Each product field is held in its own list; index i across all lists describes one product.
+
+    Attributes:
+        FIELDS (tuple): Product dictionary keys, in table column order.
+        names, prices, months, countries, currencies (list): One list per field in FIELDS.
+    """
+
+    FIELDS = ("Product", "Current Price", "Forecast Months", "Country", "Currency")
+
+    def __init__(self, products=()):
+        """
+        Args:
+            products (iterable of dict, optional): Initial products, each with keys from FIELDS.
+        """
+        self.names = []
+        self.prices = []
+        self.months = []
+        self.countries = []
+        self.currencies = []
+        self.extend(products)
+
+    def _columns(self):
+        # Column lists in FIELDS order
+        return (self.names, self.prices, self.months, self.countries, self.currencies)
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, product):
+        """
+        Add a product dictionary; missing fields are stored as empty strings.
+        """
+        for column, field in zip(self._columns(), self.FIELDS):
+            column.append(product.get(field, ''))
+
+    def extend(self, products):
+        """
+        Add every product dictionary from an iterable.
+        """
+        # Bind each column's append once; this loop runs once per imported row
+        add_name, add_price, add_months, add_country, add_currency = (
+            column.append for column in self._columns())
+        name_key, price_key, months_key, country_key, currency_key = self.FIELDS
+        for product in products:
+            get = product.get
+            add_name(get(name_key, ''))
+            add_price(get(price_key, ''))
+            add_months(get(months_key, ''))
+            add_country(get(country_key, ''))
+            add_currency(get(currency_key, ''))
+
+    def row(self, index):
+        """
+        Return the product at `index` as a tuple of values in FIELDS order.
+        """
+        return (self.names[index], self.prices[index], self.months[index],
+                self.countries[index], self.currencies[index])
+
+    def get(self, index):
+        """
+        Return the product at `index` as a new dictionary.
+        """
+        return dict(zip(self.FIELDS, self.row(index)))
+
+    def update(self, index, product):
+        """
+        Replace the fields of the product at `index` with the values in a product dictionary.
+        """
+        for column, field in zip(self._columns(), self.FIELDS):
+            column[index] = product.get(field, '')
+
+    def delete(self, index):
+        """
+        Remove the product at `index`.
+        """
+        # Each del shifts a list of pointers with one memmove (well under a millisecond per
+        # column at a million products), so deleting in place needs no tombstones
+        for column in self._columns():
+            del column[index]
+
+    def to_dicts(self):
+        """
+        Return all products as a list of new dictionaries keyed by FIELDS.
+        """
+        fields = self.FIELDS
+        return [dict(zip(fields, values)) for values in zip(*self._columns())]
@@ -4,17 +4,28 @@
 # Date: 2025-08-10
 # Description:
 #     This module contains the function to read product pricing data from an Excel file,
-#     normalize the data structure, and export it as a JSON file.
+#     normalize the data structure, and return it (optionally exporting it as a JSON file).
 #     It also supports optional deletion of the source Excel file after processing.
 # ==============================================================================
 
 import openpyxl
-import json
 import os
 
-def read_excel_to_json_gui(file_path, delete_excel=False):
+from JsonFile import write_json
+
+# Output keys with the fallback value used when the sheet has no matching column
+FIELDS = (
+    ("Product", ""),
+    ("Current Price", ""),
+    ("Forecast Months", "0"),
+    ("Country", ""),
+    ("Currency", ""),
+)
+
+
+def read_excel_to_json_gui(file_path, delete_excel=False, json_path=None):
     """
-    Reads data from an Excel file and converts it into a normalized JSON format.
+    Reads data from an Excel file and converts it into a normalized list of product dictionaries.
 
     Parameters:
     -----------
@@ -22,12 +33,16 @@ def read_excel_to_json_gui(file_path, delete_excel=False):
         The full path to the input Excel file.
     delete_excel : bool, optional (default=False)
         Flag indicating whether to delete the source Excel file after successful conversion.
+    json_path : str, optional (default=None)
+        If given, the normalized data is also written to this JSON file (e.g. "data.json"
+        for debugging). By default no file is written.
 
     Returns:
     --------
-    tuple (bool, str)
+    tuple (bool, str, list or None)
         A tuple where the first element indicates success status,
-        and the second element contains a success message or error details.
+        the second element contains a success message or error details,
+        and the third element is the list of product dictionaries (None on failure).
 
     Raises:
     -------
@@ -37,43 +52,36 @@ def read_excel_to_json_gui(file_path, delete_excel=False):
     """
 
     try:
-        # Load the Excel workbook and activate the default worksheet
-        workbook = openpyxl.load_workbook(file_path)
-        worksheet = workbook.active
-
-        # Initialize container for structured data
-        data = []
-
-        # Extract header row to use as dictionary keys
-        headers = [cell.value for cell in worksheet[1]]
-
-        # Iterate over data rows, starting from the second row (to skip headers)
-        for row in worksheet.iter_rows(min_row=2, values_only=True):
-            # Map headers to corresponding cell values in current row
-            product = dict(zip(headers, row))
+        # Load the Excel workbook in streaming read-only mode and activate the default worksheet
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            # A single row iterator: the first row is the header, the rest are products
+            rows = workbook.active.iter_rows(values_only=True)
 
-            # Normalize the data keys and provide default fallback values if necessary
-            normalized = {
-                "Product": product.get("Product", "") if isinstance(product, dict) else product[0] if product else "",
-                "Current Price": product.get("Current Price", "") if isinstance(product, dict) else (product[1] if len(product) > 1 else ""),
-                "Forecast Months": product.get("Forecast Months", "0") if isinstance(product, dict) else (product[2] if len(product) > 2 else "0"),
-                "Country": product.get("Country", "") if isinstance(product, dict) else (product[3] if len(product) > 3 else ""),
-                "Currency": product.get("Currency", "") if isinstance(product, dict) else (product[4] if len(product) > 4 else "")
-            }
+            # Extract header row and resolve the column index of each output key once
+            headers = next(rows, ())
+            index = {header: i for i, header in enumerate(headers)}
+            columns = [(key, index.get(key), default) for key, default in FIELDS]
 
-            # Append normalized entry to data list
-            data.append(normalized)
+            # Pick each key's cell directly, falling back to the default for missing columns
+            data = [
+                {key: row[i] if i is not None and i < len(row) else default for key, i, default in columns}
+                for row in rows
+            ]
+        finally:
+            # Read-only workbooks keep the file open until closed explicitly
+            workbook.close()
 
-        # Write the normalized data list to a JSON file with pretty formatting and UTF-8 encoding
-        with open("data.json", "w", encoding="utf-8") as json_file:
-            json.dump(data, json_file, indent=2, ensure_ascii=False)
+        # Optionally write the normalized data list to a JSON file with pretty formatting and UTF-8 encoding
+        if json_path:
+            write_json(json_path, data)
 
-        # Optionally delete the original Excel file after successful JSON creation
+        # Optionally delete the original Excel file after successful read
         if delete_excel:
             os.remove(file_path)
 
-        return True, "Excel file converted to JSON successfully."
+        return True, f"Excel file loaded successfully ({len(data)} products).", data
 
     except Exception as e:
         # Return failure status and error message without raising exception
-        return False, f"Error reading Excel file: {e}"
+        return False, f"Error reading Excel file: {e}", None
@@ -0,0 +1,212 @@
+# ==============================================================================
+# Module: VirtualTable.py
+# Author: Parsa Shahi
+# Date: 2026-10-15
+# Description:
+#     This module provides the scrollable product table used by the GUI.
+#     Only the rows that fit in the viewport exist as Treeview items; scrolling
+#     reuses that fixed pool of items and rewrites their values, so drawing cost
+#     and Tk memory depend on the window height, not on how many products are loaded.
+#
+#     The table keeps a reference to the product store (no copy) and reads rows
+#     from it by index through store.row(i).
+# ==============================================================================
+
+from tkinter import ttk
+
+# Fallback Treeview row height (px) used before a row has been laid out
+DEFAULT_ROW_HEIGHT = 20
+
+# Rows moved per mouse wheel notch
+WHEEL_SCROLL_ROWS = 3
+
+
+class VirtualTable(ttk.Frame):
+    """
+    Treeview with a vertical scrollbar that only materializes the visible rows of a store.
+
+    Attributes:
+        tree (ttk.Treeview): The underlying table widget.
+        store: Object providing len() and row(i) -> tuple of column values.
+    """
+
+    def __init__(self, master, columns, store, column_width=150):
+        """
+        Args:
+            master (tk.Widget): Parent widget.
+            columns (tuple of str): Column names, in the order of store.row() values.
+            store: Object providing len() and row(i).
+            column_width (int, optional): Initial width of every column in pixels.
+        """
+        super().__init__(master)
+        self.store = store
+        self._first = 0
+        self._pool = []
+        # Position of each pooled iid within the pool, so hit-testing never scans the tree
+        self._pool_pos = {}
+        self._selected = None
+
+        self.tree = ttk.Treeview(self, columns=columns, show='headings')
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=column_width, anchor='center')
+
+        # The scrollbar drives which slice of the store the tree shows
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+        self.tree.pack(side='left', fill='both', expand=True)
+
+        self.tree.bind('<Configure>', lambda event: self.refresh())
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self._on_mousewheel)
+        # The tree's own key bindings only move within the pooled rows, so navigate the store instead
+        for sequence in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>'):
+            self.tree.bind(sequence, self._on_key)
+
+    def set_store(self, store):
+        """
+        Show a different store from the top, clearing the selection.
+        """
+        self.store = store
+        self._selected = None
+        self.refresh(0)
+
+    def _visible_rows(self):
+        # Number of rows that fit in the tree below the heading
+        bbox = self.tree.bbox(self._pool[0]) if self._pool else ''
+        if bbox:
+            top, row_height = bbox[1], bbox[3]
+        else:
+            top, row_height = DEFAULT_ROW_HEIGHT, DEFAULT_ROW_HEIGHT
+        return max(1, (self.tree.winfo_height() - top) // row_height)
+
+    def refresh(self, first=None):
+        """
+        Redraw the visible rows, optionally scrolling so that store index `first` is at the top.
+
+        Call after the store changes; `first` is clamped so the last page stays full.
+        """
+        total = len(self.store)
+        rows = self._visible_rows()
+        if first is None:
+            first = self._first
+        first = max(0, min(first, total - rows))
+        self._first = first
+
+        count = min(rows, total - first)
+        while len(self._pool) < count:
+            iid = self.tree.insert('', 'end')
+            self._pool_pos[iid] = len(self._pool)
+            self._pool.append(iid)
+        if len(self._pool) > count:
+            removed = self._pool[count:]
+            self.tree.delete(*removed)
+            for iid in removed:
+                del self._pool_pos[iid]
+            del self._pool[count:]
+
+        item, row = self.tree.item, self.store.row
+        for index, iid in enumerate(self._pool, first):
+            item(iid, values=row(index))
+
+        # Keep the highlight on the selected product, not on the reused row
+        selected = self._selected
+        if selected is not None and first <= selected < first + count:
+            self.tree.selection_set(self._pool[selected - first])
+        else:
+            # One selection query, then at most one batched remove
+            current = self.tree.selection()
+            if current:
+                self.tree.selection_remove(*current)
+
+        if total:
+            self.scrollbar.set(first / total, (first + count) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+        # The pool can be one row taller than the view while the row height is still the fallback;
+        # undo any internal scroll (focus, see()) so pool[0] stays the top visible row
+        self.tree.yview_moveto(0)
+
+    def index_of(self, iid):
+        """
+        Return the store index of the product shown in tree row `iid`.
+        """
+        return self._first + self._pool_pos[iid]
+
+    def selected_index(self):
+        """
+        Return the store index of the selected row, or None if nothing is selected.
+        """
+        sel = self.tree.selection()
+        return self.index_of(sel[0]) if sel else None
+
+    def select_at(self, y):
+        """
+        Select the row under window coordinate `y`; returns its store index or None.
+        """
+        iid = self.tree.identify_row(y)
+        if not iid:
+            return None
+        self.tree.selection_set(iid)
+        self._selected = self.index_of(iid)
+        return self._selected
+
+    def clear_selection(self):
+        """
+        Forget the selected product, e.g. after it has been deleted from the store.
+        """
+        self._selected = None
+
+    def _on_select(self, event):
+        sel = self.tree.selection()
+        if sel:
+            self._selected = self.index_of(sel[0])
+
+    def _on_scrollbar(self, *args):
+        if args[0] == 'moveto':
+            first = int(float(args[1]) * len(self.store))
+        else:
+            # ('scroll', n, 'units' | 'pages')
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= max(len(self._pool), 1)
+            first = self._first + step
+        self.refresh(first)
+
+    def _on_key(self, event):
+        total = len(self.store)
+        if not total:
+            return 'break'
+        page = max(len(self._pool), 1)
+        current = self._selected if self._selected is not None else self._first
+        target = {
+            'Up': current - 1,
+            'Down': current + 1,
+            'Prior': current - page,
+            'Next': current + page,
+            'Home': 0,
+            'End': total - 1,
+        }.get(event.keysym, current)
+        if self._selected is None and event.keysym in ('Up', 'Down'):
+            # First arrow press selects the top visible row
+            target = self._first
+        target = max(0, min(target, total - 1))
+
+        # Scroll only as far as needed to bring the new selection into view
+        first = self._first
+        if target < first:
+            first = target
+        elif target >= first + page:
+            first = target - page + 1
+        self._selected = target
+        self.refresh(first)
+        self.tree.focus(self._pool[target - self._first])
+        return 'break'
+
+    def _on_mousewheel(self, event):
+        # Windows/macOS report a wheel delta; X11 sends Button-4 (up) and Button-5 (down)
+        up = event.num == 4 or event.delta > 0
+        self.refresh(self._first + (-WHEEL_SCROLL_ROWS if up else WHEEL_SCROLL_ROWS))
+        return 'break'
@@ -20,16 +20,62 @@
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from datetime import datetime
 import json
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 import os
+import re
 import sys
+from decimal import Decimal
+import importlib
+import math
+import threading
+import time
 
 # Import modules
-import CreateExcel, ReadExcel, Calculate
+# CreateExcel, ReadExcel and Calculate pull in openpyxl, numpy and reportlab; they are imported
+# where they are used and prefetched in the background once the window is up
+from ProductStore import ProductStore
+from VirtualTable import VirtualTable
 
 APP_STATE_FILE = "app_state.json"
 
+# Modules imported by _prefetch_modules after the first frame is drawn
+PREFETCH_MODULES = ('ReadExcel', 'CreateExcel', 'Calculate')
+
+# orjson is optional; it encodes and decodes the state file much faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Saves requested within this many milliseconds are coalesced into one write
+SAVE_STATE_DELAY_MS = 500
+
+# Log lines written within this many milliseconds are inserted into the log box together
+LOG_FLUSH_MS = 50
+LOG_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOG_SEPARATOR = '-' * 40
+
+# How often (ms) the UI checks whether a background forecast has finished
+CALC_POLL_MS = 100
+
+# What the price entry accepts while typing: a plain signed decimal, possibly incomplete
+# ('', '-', '12.'); commas are removed first. Exponents, 'inf' and 'nan' never match.
+PRICE_INPUT_PATTERN = re.compile(r'-?\d*\.?\d*')
+
+# Font for popup labels
+POPUP_FONT = ('Segoe UI', 10)
+
+# Add/edit popup fields: (product key, label, value shown when the product has none)
+PRODUCT_FORM_FIELDS = (
+    ('Product', 'Product Name:', ''),
+    ('Current Price', 'Current Price:', ''),
+    ('Forecast Months', 'Forecast Months:', '0'),
+    ('Country', 'Country Code (ISO2/ISO3):', ''),
+    ('Currency', 'Currency Code (e.g. USD):', 'USD'),
+)
+
 
 class PriceForecastApp(tk.Tk):
     def __init__(self):
@@ -53,28 +99,109 @@ class PriceForecastApp(tk.Tk):
                 background=[('active', '#5c6bc0'), ('pressed', '#1a237e')],
                 relief=[('pressed', 'sunken'), ('!pressed', 'flat')])
 
+        # Named label style for the add/edit popups, configured once and shared by every popup label
+        style.configure('Popup.TLabel', font=POPUP_FONT)
+
 
 
-        self.product_list = []
+        self.products = ProductStore()
         self._load_state()
 
+        # State writes are debounced on the Tk loop and performed by a background thread
+        self._save_after_id = None
+        self._pending_state = None
+        # _state_lock only guards the _pending_state handoff; _write_lock keeps writers one at a time
+        self._state_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.protocol('WM_DELETE_WINDOW', self._on_close)
+
+        # Forecasts run on a single worker thread so the window stays responsive
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._calc_future = None
+
+        # Pending log lines, flushed to the log box in one widget update
+        self._log_buffer = []
+        self._log_flush_id = None
+
+        # Add/edit popups are created on first use and then hidden and shown again
+        self._popups = {}
+        self._edit_index = None
+
+        # Tcl-side validators for the numeric popup entries, registered once
+        self._validate_number = (self.register(self._is_number), '%P')
+        self._validate_whole_number = (self.register(self._is_whole_number), '%P')
+
         self._build_ui()
 
+        # Import the heavy modules in the background so the first button click does not wait on them
+        self.after_idle(self._prefetch_modules)
+
     def _load_state(self):
         if os.path.exists(APP_STATE_FILE):
             try:
-                with open(APP_STATE_FILE, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-                    self.product_list = state.get('products', [])
+                with open(APP_STATE_FILE, 'rb') as f:
+                    raw = f.read()
+                state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self.products = ProductStore(state.get('products', []))
             except Exception:
-                self.product_list = []
+                self.products = ProductStore()
 
     def _save_state(self):
-        try:
-            with open(APP_STATE_FILE, 'w', encoding='utf-8') as f:
-                json.dump({'products': self.product_list}, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+        # Mark state dirty; the actual write happens once after SAVE_STATE_DELAY_MS
+        if self._save_after_id is None:
+            self._save_after_id = self.after(SAVE_STATE_DELAY_MS, self._flush_state)
+
+    def _flush_state(self):
+        self._save_after_id = None
+        # Snapshot on the UI thread so the writer never sees a list being edited
+        snapshot = self.products.to_dicts()
+        with self._state_lock:
+            self._pending_state = snapshot
+        threading.Thread(target=self._write_state, daemon=True).start()
+
+    def _write_state(self):
+        # Writers run one at a time and always write the newest snapshot; the UI thread
+        # never waits on _write_lock, so a slow write cannot block the next save request
+        with self._write_lock:
+            with self._state_lock:
+                products, self._pending_state = self._pending_state, None
+            if products is None:
+                return
+            try:
+                tmp_path = APP_STATE_FILE + '.tmp'
+                state = {'products': products}
+                if orjson is not None:
+                    data = orjson.dumps(state)
+                else:
+                    data = json.dumps(state, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, APP_STATE_FILE)
+            except Exception:
+                pass
+
+    def _on_close(self):
+        # Write any pending state before the window (and its daemon writer threads) go away
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+            snapshot = self.products.to_dicts()
+            with self._state_lock:
+                self._pending_state = snapshot
+        # Also waits for a write already in progress
+        self._write_state()
+        self._executor.shutdown(wait=False)
+        self.destroy()
+
+    def _prefetch_modules(self):
+        def load():
+            for name in PREFETCH_MODULES:
+                try:
+                    importlib.import_module(name)
+                except Exception:
+                    # The action that needs the module will report the error when it runs
+                    pass
+        threading.Thread(target=load, daemon=True).start()
 
     def _build_ui(self):
         # Top frame with actions
@@ -85,6 +212,7 @@ class PriceForecastApp(tk.Tk):
         btn_save = ttk.Button(top_frame, text='Save to Excel', command=self.save_to_excel_action)
         btn_load = ttk.Button(top_frame, text='Load Excel', command=self.read_excel_action)
         btn_calc = ttk.Button(top_frame, text='🔎 Calculate Forecast', command=self.calculate_forecast_action)
+        self.btn_calc = btn_calc
 
         btn_add.pack(side='left', padx=6)
         btn_save.pack(side='left', padx=6)
@@ -99,17 +227,12 @@ class PriceForecastApp(tk.Tk):
         left_frame = ttk.Frame(paned, width=600)
         paned.add(left_frame, weight=3)
 
-        columns = ("Product", "Current Price", "Forecast Months", "Country", "Currency")
-        self.table = ttk.Treeview(left_frame, columns=columns, show='headings')
-        for col in columns:
-            self.table.heading(col, text=col)
-            self.table.column(col, width=150, anchor='center')
-
+        # Column order comes from the store so table rows and store.row() tuples cannot drift apart
+        self.table = VirtualTable(left_frame, ProductStore.FIELDS, self.products)
         self.table.pack(fill='both', expand=True)
 
         # populate existing
-        for p in self.product_list:
-            self.table.insert('', 'end', values=(p.get('Product',''), p.get('Current Price',''), p.get('Forecast Months',''), p.get('Country',''), p.get('Currency','')))
+        self.table.refresh(0)
 
         # Right: log and controls
         right_frame = ttk.Frame(paned, width=300)
@@ -124,7 +247,7 @@ class PriceForecastApp(tk.Tk):
         footer.pack(side='bottom', fill='x')
 
         # Context menu for table
-        self.table.bind('<Button-3>', self._on_table_right_click)
+        self.table.tree.bind('<Button-3>', self._on_table_right_click)
         self._build_popup_menu()
 
     def _build_popup_menu(self):
@@ -133,132 +256,193 @@ class PriceForecastApp(tk.Tk):
         self.popup.add_command(label='Delete', command=self._delete_selected)
 
     def _on_table_right_click(self, event):
-        iid = self.table.identify_row(event.y)
-        if iid:
-            self.table.selection_set(iid)
+        if self.table.select_at(event.y) is not None:
             self.popup.tk_popup(event.x_root, event.y_root)
 
     def _edit_selected(self):
-        sel = self.table.selection()
-        if not sel:
+        idx = self.table.selected_index()
+        if idx is None:
             return
-        values = self.table.item(sel[0], 'values')
-        self._open_edit_popup(values, sel[0])
+        self._open_edit_popup(idx)
 
     def _delete_selected(self):
-        sel = self.table.selection()
-        if not sel:
+        idx = self.table.selected_index()
+        if idx is None:
             return
-        idx = self.table.index(sel[0])
         confirm = messagebox.askyesno('Confirm', 'Delete selected product?')
         if confirm:
-            self.table.delete(sel[0])
-            del self.product_list[idx]
+            self.products.delete(idx)
+            self.table.clear_selection()
+            # Keep an open edit popup pointing at the same product
+            if self._edit_index == idx:
+                self._edit_index = None
+            elif self._edit_index is not None and self._edit_index > idx:
+                self._edit_index -= 1
+            self.table.refresh()
             self._save_state()
             self.log_message('Product deleted.')
 
-    def add_product_popup(self):
-        popup = tk.Toplevel(self)
-        popup.title('Add Product')
-        popup.geometry('380x320')
-        popup.transient(self)
-
-        frm = ttk.Frame(popup, padding=12)
-        frm.pack(fill='both', expand=True)
-
-        ttk.Label(frm, text='Product Name:').grid(row=0, column=0, sticky='w')
-        entry_name = ttk.Entry(frm)
-        entry_name.grid(row=0, column=1, sticky='ew')
-
-        ttk.Label(frm, text='Current Price:').grid(row=1, column=0, sticky='w')
-        entry_price = ttk.Entry(frm)
-        entry_price.grid(row=1, column=1, sticky='ew')
-
-        ttk.Label(frm, text='Forecast Months:').grid(row=2, column=0, sticky='w')
-        entry_months = ttk.Entry(frm)
-        entry_months.grid(row=2, column=1, sticky='ew')
-
-        ttk.Label(frm, text='Country Code (ISO2/ISO3):').grid(row=3, column=0, sticky='w')
-        entry_country = ttk.Entry(frm)
-        entry_country.grid(row=3, column=1, sticky='ew')
-
-        ttk.Label(frm, text='Currency Code (e.g. USD):').grid(row=4, column=0, sticky='w')
-        entry_currency = ttk.Entry(frm)
-        entry_currency.grid(row=4, column=1, sticky='ew')
-
-        frm.columnconfigure(1, weight=1)
-
-        def confirm():
-            product = {
-                'Product': entry_name.get().strip(),
-                'Current Price': entry_price.get().strip(),
-                'Forecast Months': entry_months.get().strip() or '0',
-                'Country': entry_country.get().strip(),
-                'Currency': entry_currency.get().strip().upper() or 'USD'
-            }
-            self.product_list.append(product)
-            self.table.insert('', 'end', values=(product['Product'], product['Current Price'], product['Forecast Months'], product['Country'], product['Currency']))
-            self._save_state()
-            self.log_message(f"Product added: {product['Product']}")
-            popup.destroy()
-
-        ttk.Button(frm, text='Confirm', command=confirm).grid(row=5, column=0, columnspan=2, pady=12)
+    def _parse_numeric_entries(self, price_text, months_text, parent):
+        # Convert price/months once at entry time; returns (float, int) or None after showing an error
+        try:
+            price = float(price_text.strip().replace(',', ''))
+            # float() also accepts 'nan', 'inf' and overflowing values such as '1e999'
+            if not math.isfinite(price):
+                raise ValueError(price_text)
+        except ValueError:
+            messagebox.showerror('Invalid input', 'Current Price must be a number.', parent=parent)
+            return None
+        try:
+            months = int(months_text.strip() or '0')
+        except ValueError:
+            messagebox.showerror('Invalid input', 'Forecast Months must be a whole number.', parent=parent)
+            return None
+        return price, months
+
+    def _typed_product(self, product):
+        # Return a copy of an imported product with price/months converted the way the popups
+        # store them; values that cannot be converted are left as they are
+        import Calculate
+        typed = {key: ('' if value is None else value) for key, value in product.items()}
+        currency = str(typed.get('Currency', '')).strip().upper()
+
+        price = typed.get('Current Price', '')
+        if not isinstance(price, float):
+            # Excel cells may hold "$5" or "USD 40"; reuse the forecast parser and keep its currency
+            number, _, code = Calculate._parse_price(price, currency or 'USD')
+            if number is not None and math.isfinite(number):
+                typed['Current Price'] = number
+                currency = currency or code
+        typed['Currency'] = currency or 'USD'
+
+        months = typed.get('Forecast Months', '')
+        if not isinstance(months, int) or isinstance(months, bool):
+            try:
+                typed['Forecast Months'] = int(float(str(months).strip() or '0'))
+            except (ValueError, OverflowError):
+                pass
+        return typed
 
-    def _open_edit_popup(self, values, iid):
-        idx = self.table.index(iid)
-        data = self.product_list[idx]
+    def _is_number(self, text):
+        # validatecommand for the price entry: allow partial input such as '', '-' or '12.'
+        return PRICE_INPUT_PATTERN.fullmatch(text.replace(',', '')) is not None
 
-        popup = tk.Toplevel(self)
-        popup.title('Edit Product')
-        popup.geometry('380x320')
-        popup.transient(self)
+    def _is_whole_number(self, text):
+        # validatecommand for the months entry: digits only
+        return text == '' or text.isdigit()
 
+    def _build_product_form(self, popup):
+        # Lay out the product fields in `popup`; returns (frame, StringVars keyed by product field)
         frm = ttk.Frame(popup, padding=12)
         frm.pack(fill='both', expand=True)
 
-        ttk.Label(frm, text='Product Name:').grid(row=0, column=0, sticky='w')
-        entry_name = ttk.Entry(frm); entry_name.insert(0, data.get('Product',''))
-        entry_name.grid(row=0, column=1, sticky='ew')
-
-        ttk.Label(frm, text='Current Price:').grid(row=1, column=0, sticky='w')
-        entry_price = ttk.Entry(frm); entry_price.insert(0, data.get('Current Price',''))
-        entry_price.grid(row=1, column=1, sticky='ew')
-
-        ttk.Label(frm, text='Forecast Months:').grid(row=2, column=0, sticky='w')
-        entry_months = ttk.Entry(frm); entry_months.insert(0, data.get('Forecast Months','0'))
-        entry_months.grid(row=2, column=1, sticky='ew')
-
-        ttk.Label(frm, text='Country Code (ISO2/ISO3):').grid(row=3, column=0, sticky='w')
-        entry_country = ttk.Entry(frm); entry_country.insert(0, data.get('Country',''))
-        entry_country.grid(row=3, column=1, sticky='ew')
-
-        ttk.Label(frm, text='Currency Code (e.g. USD):').grid(row=4, column=0, sticky='w')
-        entry_currency = ttk.Entry(frm); entry_currency.insert(0, data.get('Currency','USD'))
-        entry_currency.grid(row=4, column=1, sticky='ew')
+        variables = {}
+        for row, (key, label, default) in enumerate(PRODUCT_FORM_FIELDS):
+            variables[key] = tk.StringVar(popup, value=default)
+            ttk.Label(frm, text=label, style='Popup.TLabel').grid(row=row, column=0, sticky='w')
+            entry = ttk.Entry(frm, textvariable=variables[key])
+            if key == 'Current Price':
+                entry.configure(validate='key', validatecommand=self._validate_number)
+            elif key == 'Forecast Months':
+                entry.configure(validate='key', validatecommand=self._validate_whole_number)
+            entry.grid(row=row, column=1, sticky='ew')
 
         frm.columnconfigure(1, weight=1)
+        return frm, variables
+
+    def _show_product_popup(self, kind, title, button_text, command, data):
+        # Show the popup for `kind` filled with `data`, building it the first time it is needed
+        if kind not in self._popups:
+            popup = tk.Toplevel(self)
+            popup.title(title)
+            popup.geometry('380x320')
+            popup.transient(self)
+            # Closing the window only hides it so the next open reuses the widgets
+            popup.protocol('WM_DELETE_WINDOW', popup.withdraw)
+            frm, variables = self._build_product_form(popup)
+            ttk.Button(frm, text=button_text, command=command).grid(row=len(PRODUCT_FORM_FIELDS), column=0, columnspan=2, pady=12)
+            self._popups[kind] = (popup, variables)
+
+        popup, variables = self._popups[kind]
+        for key, label, default in PRODUCT_FORM_FIELDS:
+            variables[key].set(self._form_text(key, data.get(key), default))
+        popup.deiconify()
+        popup.lift()
+
+    def _form_text(self, key, value, default):
+        # Entry text for a product value; numeric entries only receive text their key
+        # validator accepts, so the user can edit the pre-filled value one key at a time
+        if value is None or value == '':
+            return default
+        if isinstance(value, float):
+            # Decimal avoids exponent notation such as 1e-05, which the validator rejects
+            text = format(Decimal(repr(value)), 'f')
+        else:
+            text = str(value)
+        if key == 'Current Price' and not self._is_number(text):
+            return default
+        if key == 'Forecast Months' and not self._is_whole_number(text):
+            return default
+        return text
+
+    def _product_from_form(self, variables, parent):
+        # Read the form variables into a product dictionary, or None if the numbers are incomplete
+        numbers = self._parse_numeric_entries(variables['Current Price'].get(),
+                                              variables['Forecast Months'].get(), parent)
+        if numbers is None:
+            return None
+        return {
+            'Product': variables['Product'].get().strip(),
+            'Current Price': numbers[0],
+            'Forecast Months': numbers[1],
+            'Country': variables['Country'].get().strip(),
+            'Currency': variables['Currency'].get().strip().upper() or 'USD'
+        }
+
+    def add_product_popup(self):
+        self._show_product_popup('add', 'Add Product', 'Confirm', self._confirm_add, {})
 
-        def save():
-            data['Product'] = entry_name.get().strip()
-            data['Current Price'] = entry_price.get().strip()
-            data['Forecast Months'] = entry_months.get().strip() or '0'
-            data['Country'] = entry_country.get().strip()
-            data['Currency'] = entry_currency.get().strip().upper() or 'USD'
+    def _confirm_add(self):
+        popup, variables = self._popups['add']
+        product = self._product_from_form(variables, popup)
+        if product is None:
+            return
+        self.products.append(product)
+        # Scroll to the end so the new product is visible
+        self.table.refresh(len(self.products))
+        self._save_state()
+        self.log_message(f"Product added: {product['Product']}")
+        popup.withdraw()
+
+    def _open_edit_popup(self, idx):
+        self._edit_index = idx
+        # Products saved before prices were typed at entry may still hold raw strings
+        data = self._typed_product(self.products.get(idx))
+        self._show_product_popup('edit', 'Edit Product', 'Save', self._save_edit, data)
+
+    def _save_edit(self):
+        popup, variables = self._popups['edit']
+        product = self._product_from_form(variables, popup)
+        if product is None:
+            return
+        idx = self._edit_index
+        # None when the product was deleted or replaced while the popup was open
+        if idx is not None:
+            self.products.update(idx, product)
             # update table row
-            self.table.item(iid, values=(data['Product'], data['Current Price'], data['Forecast Months'], data['Country'], data['Currency']))
+            self.table.refresh()
             self._save_state()
             self.log_message('Product updated.')
-            popup.destroy()
-
-        ttk.Button(frm, text='Save', command=save).grid(row=5, column=0, columnspan=2, pady=12)
+        popup.withdraw()
 
     def save_to_excel_action(self):
-        if not self.product_list:
+        if not self.products:
             messagebox.showwarning('Warning', 'No products to save.')
             return
         file_path = filedialog.asksaveasfilename(defaultextension='.xlsx', filetypes=[('Excel Files', '*.xlsx')])
         if file_path:
-            success, msg = CreateExcel.save_to_excel(self.product_list, file_path)
+            import CreateExcel
+            success, msg = CreateExcel.save_to_excel(self.products.to_dicts(), file_path)
             self.log_message(msg)
             if success:
                 messagebox.showinfo('Success', msg)
@@ -266,46 +450,68 @@ class PriceForecastApp(tk.Tk):
     def read_excel_action(self):
         file_path = filedialog.askopenfilename(filetypes=[('Excel Files', '*.xlsx')])
         if file_path:
-            success, msg = ReadExcel.read_excel_to_json_gui(file_path)
+            import ReadExcel
+            success, msg, data = ReadExcel.read_excel_to_json_gui(file_path)
             self.log_message(msg)
             if success:
-                # try load generated data.json
-                try:
-                    with open('data.json', 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        # clear table and load
-                        for r in self.table.get_children():
-                            self.table.delete(r)
-                        self.product_list = data
-                        for p in data:
-                            self.table.insert('', 'end', values=(p.get('Product',''), p.get('Current Price',''), p.get('Forecast Months',''), p.get('Country',''), p.get('Currency','')))
-                        self._save_state()
-                except Exception as e:
-                    self.log_message(f'Could not load data.json: {e}')
+                # clear table and load, typing imported prices/months once
+                self.products = ProductStore(self._typed_product(product) for product in data)
+                self._edit_index = None
+                self.table.set_store(self.products)
+                self._save_state()
                 messagebox.showinfo('Success', msg)
 
     def calculate_forecast_action(self):
-        if not self.product_list:
+        if not self.products:
             messagebox.showwarning('Warning', 'No products to forecast.')
             return
-        # call Calculate.main
-        success, msg = Calculate.main(self.product_list)
+        if self._calc_future is not None:
+            return
+        import Calculate
+        # call Calculate.main on the worker thread with a snapshot of the products
+        self._calc_future = self._executor.submit(Calculate.main, self.products.to_dicts())
+        self.btn_calc.state(['disabled'])
+        self.log_message('Forecast started...')
+        self.after(CALC_POLL_MS, self._poll_calc)
+
+    def _poll_calc(self):
+        # Tk must only be touched from the main thread, so the result is picked up here
+        if not self._calc_future.done():
+            self.after(CALC_POLL_MS, self._poll_calc)
+            return
+        fut, self._calc_future = self._calc_future, None
+        self.btn_calc.state(['!disabled'])
+        try:
+            success, msg = fut.result()
+        except Exception as e:
+            success, msg = False, f'Forecast failed: {e}'
         self.log_message(msg)
         if success:
             messagebox.showinfo('Success', msg)
 
     def log_message(self, message):
+        ts = time.strftime(LOG_TIME_FORMAT)
+        self._log_buffer.append(f'[{ts}] {message}\n{LOG_SEPARATOR}\n')
+        if self._log_flush_id is None:
+            self._log_flush_id = self.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        # Insert all buffered lines with a single enable/insert/disable cycle
+        self._log_flush_id = None
         self.log_box.config(state='normal')
-        ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self.log_box.insert('end', f'[{ts}] {message}\n' + '-'*40 + '\n')
+        self.log_box.insert('end', ''.join(self._log_buffer))
         self.log_box.config(state='disabled')
         self.log_box.see('end')
+        self._log_buffer.clear()
 
 
 if __name__ == '__main__':
     import sys
     import os
 
+    # Required for the worker processes Calculate uses when running as a frozen executable
+    multiprocessing.freeze_support()
+
     if getattr(sys, 'frozen', False):
         base_dir = sys._MEIPASS
     else: